@@ -11,8 +11,8 @@ from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from requests import Session
 from subprocess import PIPE, Popen
-from threading import Event
-from typing import Any, Optional
+from threading import Event, Thread
+from typing import Any, IO, Optional
 
 from azureml._run_impl.run_watcher import RunWatcher
 from azureml.tensorboard import Tensorboard
@@ -37,6 +37,23 @@ class HimlTensorboardConfig(AmlRunScriptConfig):
     port: int = param.Integer(default=6006, doc="The port to run Tensorboard on")
 
 
+def _drain_pipe(pipe: Optional[IO[str]]) -> None:
+    """
+    Read and discard all output from the given pipe in a daemon thread, until the pipe is closed. This prevents a
+    subprocess from blocking once the OS buffer of a pipe that nobody reads from is full.
+
+    :param pipe: The pipe to drain. If None, nothing is done.
+    """
+    if pipe is None:
+        return
+
+    def _read_until_closed(pipe_to_read: IO[str]) -> None:
+        for _ in iter(pipe_to_read.readline, ""):
+            pass
+
+    Thread(target=_read_until_closed, args=(pipe,), daemon=True).start()
+
+
 class WrappedTensorboard(Tensorboard):
     def __init__(self, remote_root: str, **kwargs: Any) -> None:
         super().__init__(**kwargs)
@@ -102,6 +119,10 @@ class WrappedTensorboard(Tensorboard):
             self._win32_kill_subprocess_on_exit(self._tb_proc)
 
         url = self._wait_for_url()
+        # The pipes are only needed to find the URL. Keep draining them afterwards, otherwise a long running
+        # Tensorboard process blocks when writing logs once the pipe buffers are full.
+        _drain_pipe(self._tb_proc.stdout)
+        _drain_pipe(self._tb_proc.stderr)
         # in notebooks, this shows as a clickable link (whereas the returned value is not parsed in output)
         logging.info(f"Tensorboard running at: {url}")
 
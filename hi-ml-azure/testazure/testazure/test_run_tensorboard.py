@@ -118,3 +118,13 @@ import sys
     assert ts.remote_root == str(remote_root)
     assert ts._local_root == str(local_root)
     ts.stop()
+
+
+def test_drain_pipe_unblocks_subprocess() -> None:
+    # Write much more than the typical 64 KiB pipe buffer. Without draining, the subprocess would block forever.
+    script = "import sys; [sys.stdout.write('x' * 1023 + '\\n') for _ in range(1024)]"
+    proc = subprocess.Popen(["python", "-c", script], stdout=subprocess.PIPE, universal_newlines=True)
+    himl_tensorboard._drain_pipe(proc.stdout)
+    assert proc.wait(timeout=30) == 0
+    # Passing no pipe is a no-op
+    himl_tensorboard._drain_pipe(None)
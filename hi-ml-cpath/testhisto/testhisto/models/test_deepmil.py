@@ -53,6 +53,20 @@ from torch.utils.data import DataLoader
 no_gpu = not is_gpu_available()
 
 
+@pytest.fixture(scope="session")
+def supervised_imagenet_encoder() -> TileEncoder:
+    """A single Resnet18 encoder in eval mode, shared by the tests that only need its forward pass
+    (test_lightningmodule_with_imagenet_encoder and the class weights tests) to avoid rebuilding it in each of them."""
+    encoder = get_supervised_imagenet_encoder_params().get_encoder(outputs_folder=None)
+    encoder.eval()
+    return encoder
+
+
+def patch_get_encoder(encoder: TileEncoder) -> Any:
+    """Patch `EncoderParams.get_encoder` so that newly created DeepMILModules use the given encoder instance."""
+    return patch("health_cpath.models.deepmil.EncoderParams.get_encoder", return_value=encoder)
+
+
 def get_supervised_imagenet_encoder_params(tune_encoder: bool = True, is_caching: bool = False) -> EncoderParams:
     return EncoderParams(encoder_type=Resnet18.__name__, tune_encoder=tune_encoder, is_caching=is_caching)
 
@@ -76,6 +90,7 @@ def get_transformer_pooling_layer_params(
 
 
 def _test_lightningmodule(
+    encoder: TileEncoder,
     n_classes: int,
     batch_size: int,
     max_bag_size: int,
@@ -84,13 +99,14 @@ def _test_lightningmodule(
 ) -> None:
     assert n_classes > 0
 
-    module = DeepMILModule(
-        label_column=DEFAULT_LABEL_COLUMN,
-        n_classes=n_classes,
-        classifier_params=ClassifierParams(dropout_rate=dropout_rate),
-        encoder_params=get_supervised_imagenet_encoder_params(),
-        pooling_params=get_attention_pooling_layer_params(pool_out_dim),
-    )
+    with patch_get_encoder(encoder):
+        module = DeepMILModule(
+            label_column=DEFAULT_LABEL_COLUMN,
+            n_classes=n_classes,
+            classifier_params=ClassifierParams(dropout_rate=dropout_rate),
+            encoder_params=get_supervised_imagenet_encoder_params(),
+            pooling_params=get_attention_pooling_layer_params(pool_out_dim),
+        )
 
     bag_images = rand([batch_size, max_bag_size, *module.encoder.input_dim])
     bag_labels_list = []
@@ -102,7 +118,10 @@ def _test_lightningmodule(
         else:
             labels = randint(n_classes + 1, size=(max_bag_size,))
         bag_labels_list.append(module.get_bag_label(labels))
-        logit, attn = module(bag)
+        # The module is not trained here, so we skip building the autograd graph on the forward passes. The module
+        # stays in train mode so that the classifier dropout is still exercised.
+        with torch.inference_mode():
+            logit, attn = module(bag)
         assert logit.shape == (1, n_classes)
         assert attn.shape == (pool_out_dim, max_bag_size)
         bag_logits_list.append(logit.view(-1))
@@ -158,11 +177,22 @@ def _test_lightningmodule(
             assert torch.all(score <= 1)
 
 
-@pytest.mark.parametrize("n_classes", [1, 3])
-@pytest.mark.parametrize("batch_size", [1, 5])
-@pytest.mark.parametrize("max_bag_size", [1, 5])
-@pytest.mark.parametrize("pool_out_dim", [1, 6])
-@pytest.mark.parametrize("dropout_rate", [None, 0.5])
+# A pairwise covering array over the parameters of test_lightningmodule_attention: every pair of values of any two
+# parameters appears in at least one case, which needs 6 cases instead of the 32 of the full cartesian product.
+LIGHTNINGMODULE_PAIRWISE_CASES = [
+    # (n_classes, batch_size, max_bag_size, pool_out_dim, dropout_rate)
+    (1, 1, 1, 1, None),
+    (3, 5, 1, 1, 0.5),
+    (3, 1, 5, 1, 0.5),
+    (3, 1, 1, 6, None),
+    (1, 5, 5, 6, 0.5),
+    (1, 5, 5, 6, None),
+]
+
+
+@pytest.mark.parametrize(
+    "n_classes, batch_size, max_bag_size, pool_out_dim, dropout_rate", LIGHTNINGMODULE_PAIRWISE_CASES
+)
 def test_lightningmodule_attention(
     n_classes: int,
     batch_size: int,
@@ -170,7 +200,9 @@ def test_lightningmodule_attention(
     pool_out_dim: int,
     dropout_rate: Optional[float],
 ) -> None:
+    # The parametrized cases exercise the MIL pooling and classification head, so a tiny identity encoder is enough
     _test_lightningmodule(
+        encoder=IdentityEncoder(input_dim=(16,)),
         n_classes=n_classes,
         batch_size=batch_size,
         max_bag_size=max_bag_size,
@@ -179,14 +211,38 @@ def test_lightningmodule_attention(
     )
 
 
-def validate_metric_inputs(scores: torch.Tensor, labels: torch.Tensor) -> None:
-    def is_integral(x: torch.Tensor) -> bool:
-        return (x == x.long()).all()  # type: ignore
+def test_lightningmodule_with_imagenet_encoder(supervised_imagenet_encoder: TileEncoder) -> None:
+    _test_lightningmodule(
+        encoder=supervised_imagenet_encoder,
+        n_classes=3,
+        batch_size=2,
+        max_bag_size=3,
+        pool_out_dim=1,
+        dropout_rate=None,
+    )
+
+
+def is_integral(x: torch.Tensor) -> bool:
+    if not torch.is_floating_point(x):
+        return True
+    return torch.equal(x, x.trunc())
+
+
+def get_metric_inputs_validator() -> Callable[[torch.Tensor, torch.Tensor], None]:
+    """Returns a callback that validates the inputs passed to a metric update. The scores value check is only run once
+    for each scores tensor, as all metrics of a module are updated with the same scores."""
+    # Keeping a reference to the validated tensors guarantees that their ids are not reused by new tensors
+    validated_scores: Dict[int, torch.Tensor] = {}
 
-    assert labels.shape == (scores.shape[0],)
-    assert torch.is_floating_point(scores), "Received scores with integer dtype"
-    assert not is_integral(scores), "Received scores with integral values"
-    assert is_integral(labels), "Received labels with floating-point values"
+    def validate_metric_inputs(scores: torch.Tensor, labels: torch.Tensor) -> None:
+        assert labels.shape == (scores.shape[0],)
+        assert torch.is_floating_point(scores), "Received scores with integer dtype"
+        assert is_integral(labels), "Received labels with floating-point values"
+        if id(scores) not in validated_scores:
+            assert not is_integral(scores), "Received scores with integral values"
+            validated_scores[id(scores)] = scores
+
+    return validate_metric_inputs
 
 
 def add_callback(fn: Callable, callback: Callable) -> Callable:
@@ -242,6 +298,7 @@ def test_metrics(n_classes: int) -> None:
 
         # Patch the metrics to check that the inputs are valid. In particular, test that the scores
         # do not have integral values, which would suggest that hard labels were passed instead.
+        validate_metric_inputs = get_metric_inputs_validator()
         for metric_obj in module_metrics_dict.values():
             metric_obj.update = add_callback(metric_obj.update, validate_metric_inputs)
 
@@ -375,17 +432,18 @@ def test_mock_panda_container_gpu(
     _test_mock_panda_container(use_gpu=True, mock_container=mock_container, tmp_path=request.getfixturevalue(tmp_path))
 
 
-def test_class_weights_binary() -> None:
+def test_class_weights_binary(supervised_imagenet_encoder: TileEncoder) -> None:
     class_weights = Tensor([0.5, 3.5])
     n_classes = 1
 
-    module = DeepMILModule(
-        label_column=DEFAULT_LABEL_COLUMN,
-        n_classes=n_classes,
-        class_weights=class_weights,
-        encoder_params=get_supervised_imagenet_encoder_params(),
-        pooling_params=get_attention_pooling_layer_params(pool_out_dim=1),
-    )
+    with patch_get_encoder(supervised_imagenet_encoder):
+        module = DeepMILModule(
+            label_column=DEFAULT_LABEL_COLUMN,
+            n_classes=n_classes,
+            class_weights=class_weights,
+            encoder_params=get_supervised_imagenet_encoder_params(),
+            pooling_params=get_attention_pooling_layer_params(pool_out_dim=1),
+        )
 
     logits = Tensor(randn(1, n_classes))
     bag_label = randint(n_classes + 1, size=(1,))
@@ -400,17 +458,18 @@ def test_class_weights_binary() -> None:
         assert allclose(loss_weighted, loss_unweighted)
 
 
-def test_class_weights_multiclass() -> None:
+def test_class_weights_multiclass(supervised_imagenet_encoder: TileEncoder) -> None:
     class_weights = Tensor([0.33, 0.33, 0.33])
     n_classes = 3
 
-    module = DeepMILModule(
-        label_column=DEFAULT_LABEL_COLUMN,
-        n_classes=n_classes,
-        class_weights=class_weights,
-        encoder_params=get_supervised_imagenet_encoder_params(),
-        pooling_params=get_attention_pooling_layer_params(pool_out_dim=1),
-    )
+    with patch_get_encoder(supervised_imagenet_encoder):
+        module = DeepMILModule(
+            label_column=DEFAULT_LABEL_COLUMN,
+            n_classes=n_classes,
+            class_weights=class_weights,
+            encoder_params=get_supervised_imagenet_encoder_params(),
+            pooling_params=get_attention_pooling_layer_params(pool_out_dim=1),
+        )
 
     logits = Tensor(randn(1, n_classes))
     bag_label = randint(n_classes, size=(1,))